@@ -1,11 +1,15 @@
 from gdess import load_stations_dict
-import xarray as xr
-import glob, os, re, argparse, shlex
+import netCDF4
+import os, re, argparse, shlex, functools
+from typing import Iterable
 
 # -- Define valid surface station choices --
 station_dict = load_stations_dict()
 station_code_choices = list(station_dict.keys())
 
+# -- Filename pattern for the surface station files, e.g. "co2_mlo_surface-insitu_1_allvalid.nc" --
+SURFACE_NC_RE = re.compile(r'^co2_(?P<station_code>[a-zA-Z0-9]+)_surface.*\.nc$')
+
 
 def valid_surface_stations(station_arg: str) -> str:
     """Validate that a string containing one or more station codes are present in the available dataset
@@ -26,6 +30,63 @@ def valid_surface_stations(station_arg: str) -> str:
     return station_arg
 
 
+def _scan_surface_files(datadir: str,
+                        station_codes: Iterable[str] = None
+                        ) -> dict:
+    """Group the directory entries of surface station files by station code, in a single pass.
+
+    Parameters
+    ----------
+    datadir : str
+        the directory containing netcdf files for the station data
+    station_codes : Iterable[str], optional
+        if provided, only files for these station codes are retained
+
+    Returns
+    -------
+    dict
+        Contains (keys) station codes, and for each station (values) a list of os.DirEntry objects
+    """
+    code_set = None if station_codes is None else set(station_codes)
+
+    entries_by_code = dict()
+    with os.scandir(datadir) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            m = SURFACE_NC_RE.match(entry.name)
+            if not m:
+                continue
+            code = m['station_code']
+            if (code_set is not None) and (code not in code_set):
+                continue
+            entries_by_code.setdefault(code, []).append(entry)
+
+    return entries_by_code
+
+
+def get_dict_of_station_filepaths(datadir: str,
+                                  station_codes: Iterable[str] = None
+                                  ) -> dict:
+    """Build a dictionary that contains a key for each station code,
+       and with a list of file paths for each key, using a single pass through the directory.
+
+    Parameters
+    ----------
+    datadir : str
+        the directory containing netcdf files for the station data
+    station_codes : Iterable[str], optional
+        if provided, only files for these station codes are retained
+
+    Returns
+    -------
+    dict
+        Contains (keys) three-letter station codes, and for each station (values) a list of data file paths
+    """
+    return {k: [e.path for e in v]
+            for k, v in _scan_surface_files(datadir, station_codes).items()}
+
+
 def get_dict_of_all_station_filenames(datadir: str) -> dict:
     """Build a dictionary that contains a key for each station code,
        and with a list of filenames for each key.
@@ -40,25 +101,68 @@ def get_dict_of_all_station_filenames(datadir: str) -> dict:
     dict
         Contains (keys) three-letter station codes, and for each station (values) a list of data filenames
     """
-    filepath_list = glob.glob(datadir + '*surface*.nc')
-    filenames = [os.path.basename(x) for x in filepath_list]
+    return {k: list(v)
+            for k, v in _station_filenames_cached(*dir_cache_key(datadir)).items()}
+
+
+def get_dict_of_station_codes_and_names(datadir: str) -> dict:
+    """Build a dictionary that contains a key for each station code, with the station's full name.
+
+    Parameters
+    ----------
+    datadir : str
+        the directory containing netcdf files for the station data
+
+    Returns
+    -------
+    dict
+        Contains (keys) three-letter station codes, and for each station (values) a dict with the 'name'
+    """
+    return {k: dict(v)
+            for k, v in _station_codes_and_names_cached(*dir_cache_key(datadir)).items()}
+
+
+def dir_cache_key(datadir: str) -> tuple:
+    """Build a memoization key for a directory, which changes whenever files are added to or removed from it.
+
+    Parameters
+    ----------
+    datadir : str
 
-    # regex to get the station code from each filename
-    pattern = r"co2_(?P<station_code>.*)_surface.*"
+    Returns
+    -------
+    tuple
+        the absolute path of the directory, and its modification time (in nanoseconds)
+    """
+    return os.path.abspath(datadir), os.stat(datadir).st_mtime_ns
 
-    dict_to_build = dict()
-    for f in filenames:
-        result = re.match(pattern, f)['station_code']
-        if result not in dict_to_build.keys():
-            dict_to_build[result] = [f]
-        else:
-            dict_to_build[result].append(f)
 
-    return dict_to_build
+@functools.lru_cache(maxsize=32)
+def _station_filenames_cached(datadir: str, mtime_ns: int) -> dict:
+    """Group the surface station filenames by station code, memoized per directory (and modification time)"""
+    return {k: [e.name for e in v]
+            for k, v in _scan_surface_files(datadir).items()}
 
 
-def get_dict_of_station_codes_and_names(datadir: str) -> dict:
-    stations_dict = get_dict_of_all_station_filenames(datadir)
-    return {k: {'name': xr.open_dataset(os.path.join(datadir, stations_dict[k][0])).attrs['site_name']}
+@functools.lru_cache(maxsize=32)
+def _station_codes_and_names_cached(datadir: str, mtime_ns: int) -> dict:
+    """Read the full name of each surface station, memoized per directory (and modification time)"""
+    stations_dict = get_dict_of_station_filepaths(datadir)
+    return {k: {'name': read_site_name(v[0])}
             for k, v
             in stations_dict.items()}
+
+
+def read_site_name(filepath: str) -> str:
+    """Read the 'site_name' global attribute from a station file, without decoding any variables.
+
+    Parameters
+    ----------
+    filepath : str
+
+    Returns
+    -------
+    str
+    """
+    with netCDF4.Dataset(filepath, 'r') as nc:
+        return nc.getncattr('site_name')
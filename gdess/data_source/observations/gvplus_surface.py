@@ -1,13 +1,19 @@
 from typing import Union
-import os, re, glob, argparse, logging
+import os, argparse, logging, functools
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
+import xarray as xr
 import matplotlib.pyplot as plt
-from matplotlib.dates import DateFormatter
+import matplotlib.dates as mdates
+from matplotlib.ticker import FuncFormatter
 
 from gdess import set_verbose, load_stations_dict, load_config_file, benchmark_recipe
 from gdess.data_source.observations.load import load_data_with_regex, dataset_from_filelist
+from gdess.data_source.observations.gvplus_name_utils import get_dict_of_station_filepaths, dir_cache_key, SURFACE_NC_RE
+from gdess.data_source.observations.station_table import StationTable
 from gdess.data_source.multiset import Multiset
 from gdess.operations.datasetdict import DatasetDict
 from gdess.operations.time import select_between, ensure_dataset_datetime64, ensure_datetime64_array
@@ -20,7 +26,10 @@ from gdess.formatters import append_before_extension
 _logger = logging.getLogger("{0}.{1}".format(__name__, "loader"))
 
 # Define the stations that will be included in the dataset and available for diagnostic plots
-station_dict = load_stations_dict()
+#   (a read-only mapping, shared by all instances; per-instance lat/lon/alt are kept in Collection.station_meta)
+_BASE_STATIONS = MappingProxyType({code: MappingProxyType(v) for code, v in load_stations_dict().items()})
+station_dict = _BASE_STATIONS
+_STATION_CODES_FROZEN = frozenset(station_dict)
 
 
 class Collection(Multiset):
@@ -36,7 +45,9 @@ class Collection(Multiset):
 
         self.df_combined_and_resampled = None
         # Define the stations that will be included in the dataset and available for diagnostic plots
-        self.station_dict = station_dict.copy()
+        self.station_dict = _BASE_STATIONS
+        # The latitude, longitude, and altitude of each station are filled in when data are loaded.
+        self.station_meta = StationTable(_BASE_STATIONS)
 
         super().__init__(verbose=verbose)
 
@@ -77,8 +88,7 @@ class Collection(Multiset):
         new_self.df_combined_and_resampled = (new_self
                                               .get_resampled_dataframe(new_self.stepA_original_datasets[opts.station_code],
                                                                        timestart=opts.start_datetime,
-                                                                       timeend=opts.end_datetime
-                                                                       ).reset_index())
+                                                                       timeend=opts.end_datetime))
 
         # --- Plotting ---
         fig, ax, bbox_artists = new_self.plot_station_time_series(stationshortname=opts.station_code)
@@ -137,7 +147,8 @@ class Collection(Multiset):
         fig, ax, bbox_artists = plot_annual_series(df_anomaly_yearly, df_anomaly_mean_cycle,
                                                    titlestr="")
         ax.text(0.02, 0.92, f"{opts.station_code.upper()}, "
-                            f"{station_dict[opts.station_code]['lat']:.1f}, {station_dict[opts.station_code]['lon']:.1f}",
+                            f"{new_self.station_meta[opts.station_code]['lat']:.1f}, "
+                            f"{new_self.station_meta[opts.station_code]['lon']:.1f}",
                 horizontalalignment='left', verticalalignment='center', transform=ax.transAxes)
         #
 
@@ -156,6 +167,11 @@ class Collection(Multiset):
         ----------
         datadir : `str`
         station_name : `str` or `list`
+
+        Raises
+        ------
+        KeyError
+            If any station code is not in the predefined dictionary of stations
         """
         _logger.debug("Preprocessing...")
         if not station_name:
@@ -164,8 +180,11 @@ class Collection(Multiset):
         else:
             # Create a subset of the station dictionary containing only the station name(s) passed in
             if isinstance(station_name, str):
-                station_name = [station_name]
-            stations = dict((k, self.station_dict[k]) for k in station_name)
+                station_name = (station_name,)
+            missing = set(station_name) - _STATION_CODES_FROZEN
+            if missing:
+                raise KeyError('Unrecognized station code(s): %s' % sorted(missing))
+            stations = {k: self.station_dict[k] for k in station_name}
 
         if not datadir:
             # A configuration object (for holding paths and settings) is read in to get the path to the data.
@@ -173,7 +192,10 @@ class Collection(Multiset):
             datadir = config.get('NOAA_Globalview', 'source', vars=os.environ)
             _logger.debug(f"Loading local Globalview data files from path <{datadir}>..")
 
-        self.stepA_original_datasets = DatasetDict(self._load_stations_by_namedict(stations, datadir))
+        ds_obs_dict, latlonalt_by_code = self._load_stations_by_namedict(stations, datadir)
+        for code, station_latlonalt in latlonalt_by_code.items():
+            self.station_meta.update(code, station_latlonalt)
+        self.stepA_original_datasets = DatasetDict(ds_obs_dict)
         _logger.debug("Preprocessing is done.")
 
     @staticmethod
@@ -195,35 +217,37 @@ class Collection(Multiset):
         """
         _logger.debug('Resampling obspack observations..')
         # --- OBSERVATIONS ---
-        # Time period is selected.
+        # Time period is selected, and the (single station's) data are read into memory once.
         ds_sub_obs = select_between(dataset=dataset_obs,
                                     timestart=timestart, timeend=timeend,
                                     varlist=['time', 'co2'],
-                                    drop_dups=True)
-        # Dataset converted to DataFrame.
-        df_prepd_obs_orig = ds_sub_obs.to_dataframe().reset_index()
-        df_prepd_obs_orig.rename(columns={'co2': 'obs_original_resolution'}, inplace=True)
+                                    drop_dups=True).compute()
 
         # --- Resampled observations ---
-        #     ds_resampled = ds_sub_obs.resample(time="1D").interpolate("linear")  # weekly average
-        ds_resampled = ds_sub_obs.resample(time="1MS").mean()  # monthly average
-        # ds_resampled = ds_sub_obs.resample(time="1AS").mean()  # yearly average
-        # ds_resampled = ds_sub_obs.resample(time="Q").mean()  # quarterly average (consecutive three-month periods)
-        # ds_resampled = ds_sub_obs.resample(time="QS-DEC").mean()  # quarterly average (consecutive three-month periods), anchored at December 1st.
-        #
-        # Dataset converted to DataFrame.
-        df_prepd_obs_resamp = (ds_resampled
-                               .dropna(dim=('time'))
-                               .to_dataframe().reset_index()
-                               .rename(columns={'co2': 'obs_resampled_resolution'})
-                               )
+        # Missing values are dropped once up front, so the reduction can skip its NaN-aware path.
+        ds_valid_obs = ds_sub_obs.dropna(dim='time', subset=['co2'])
+        #     ds_resampled = ds_valid_obs.resample(time="1D").interpolate("linear")  # weekly average
+        ds_resampled = ds_valid_obs.resample(time="1MS").mean(skipna=False)  # monthly average
+        # ds_resampled = ds_valid_obs.resample(time="1AS").mean()  # yearly average
+        # ds_resampled = ds_valid_obs.resample(time="Q").mean()  # quarterly average (consecutive three-month periods)
+        # ds_resampled = ds_valid_obs.resample(time="QS-DEC").mean()  # quarterly average (consecutive three-month periods), anchored at December 1st.
+
+        # Only the needed arrays are extracted into a DataFrame (indexed by time), leaving the other coordinates out.
+        df_prepd_obs_orig = pd.DataFrame({'obs_original_resolution': ds_sub_obs['co2'].values},
+                                         index=pd.DatetimeIndex(ds_sub_obs['time'].values.astype('datetime64[s]'),
+                                                                name='time'))
+        ds_resampled = ds_resampled.dropna(dim=('time'))
+        df_prepd_obs_resamp = pd.DataFrame({'obs_resampled_resolution': ds_resampled['co2'].values},
+                                           index=pd.DatetimeIndex(ds_resampled['time'].values.astype('datetime64[s]'),
+                                                                  name='time'))
 
         # --- COMBINED ---
-        df_prepd = (df_prepd_obs_resamp
-                    .merge(df_prepd_obs_orig, on='time', how='outer')
-                    .reset_index()
-                    .loc[:, ['time', 'obs_original_resolution', 'obs_resampled_resolution']]
-                    )
+        # Both DataFrames have a sorted time index, so they are aligned by a (sorted) index union and reindexing.
+        idx = df_prepd_obs_orig.index.union(df_prepd_obs_resamp.index)
+        df_prepd = pd.DataFrame(index=idx)
+        df_prepd['obs_original_resolution'] = df_prepd_obs_orig['obs_original_resolution'].reindex(idx).values
+        df_prepd['obs_resampled_resolution'] = df_prepd_obs_resamp['obs_resampled_resolution'].reindex(idx).values
+        df_prepd = df_prepd.rename_axis('time').reset_index()
 
         _logger.debug('  First resampled row: %s', df_prepd.iloc[0, :])
         _logger.debug('Done.')
@@ -246,16 +270,23 @@ class Collection(Multiset):
             Names, latitudes, longitudes, and altitudes of each station
         """
         # --- Go through files and extract all 'surface' sampled files ---
-        p = re.compile(r'co2_([a-zA-Z0-9]*)_surface.*\.nc$')
-        return_value = load_data_with_regex(datadir=datadir, compiled_regex_pattern=p)
+        return_value = load_data_with_regex(datadir=datadir, compiled_regex_pattern=SURFACE_NC_RE,
+                                            name_prefix='co2_')
         return return_value
 
     @staticmethod
     def _load_stations_by_namedict(station_dict: dict,
                                    datadir: str
-                                   ) -> dict:
+                                   ) -> (dict, dict):
         """Load into memory the data for surface observing stations from Globalview+.
 
+        Note
+        ----
+        Nothing passed in is modified. Results are memoized by the station codes (in order) and the data directory,
+        so repeated calls with the same inputs don't reload the files.
+        The returned dictionaries are new, but the Dataset objects in them are shared with the cache (and with
+        other Collections), so they should not be modified in place.
+
         Parameters
         ----------
         station_dict : `dict`
@@ -265,62 +296,63 @@ class Collection(Multiset):
         Returns
         -------
         `dict`
-            Names, latitudes, longitudes, and altitudes of each station
+            Datasets for each station
+        `dict`
+            Latitudes, longitudes, and altitudes of each station
         """
-        ds_obs_dict = {}
-        for stationcode, _ in station_dict.items():
-            _logger.debug(stationcode)
-            _logger.debug('data directory: %s', datadir)
-
-            file_list = glob.glob(os.path.join(datadir, f"co2_{stationcode}*.nc"))
-            # print("files: ")
-            # print(*[os.path.basename(x) for x in file_list], sep = "\n")
+        # The cache is keyed on the directory's modification time too, so added or removed files aren't missed.
+        ds_obs_dict, latlonalt_by_code = _load_stations_cached(tuple(station_dict), *dir_cache_key(datadir))
+        return dict(ds_obs_dict), dict(latlonalt_by_code)
 
-            _logger.debug('Station files: %s', ', '.join([os.path.basename(x) for x in file_list]))
-            ds_obs_dict[stationcode] = dataset_from_filelist(file_list)
-
-            # Simple unit check - for the Altitude variable
-            check_altitude_unit = ds_obs_dict[stationcode]['altitude'].attrs['units'] == 'm'
-            if not check_altitude_unit:
-                raise ValueError('unexpected altitude units <%s>', ds_obs_dict[stationcode]['altitude'].attrs['units'])
-
-            lats = ds_obs_dict[stationcode]['latitude'].values
-            lons = ds_obs_dict[stationcode]['longitude'].values
-            alts = ds_obs_dict[stationcode]['altitude'].values
-
-            # Get the latitude and longitude of each station
-            #     different_station_lats = np.unique(lats)
-            #     different_station_lons = np.unique(lons)
-            # print(f"there are {len(different_station_lons)} different latitudes for the station: {different_station_lons}")
+    @staticmethod
+    def _load_one_station(stationcode: str,
+                          file_list: list
+                          ) -> tuple:
+        """Load, check, and format the data for a single surface observing station.
 
-            # Get the average lat,lon
-            meanlon = lons.mean()
-            if meanlon < 0:
-                meanlon = meanlon + 360
-            station_latlonalt = {'lat': lats.mean(), 'lon': meanlon, 'alts': alts.mean()}
-            _logger.debug("  %s" % station_latlonalt)
+        Parameters
+        ----------
+        stationcode : `str`
+        file_list : `list`
+            paths of the Globalview+ NetCDF files for this station
 
-            station_dict[stationcode].update(station_latlonalt)
+        Returns
+        -------
+        `tuple`
+            the station code, the station's xr.Dataset, and a dict of the station's latitude, longitude, and altitude
+        """
+        _logger.debug(stationcode)
+        _logger.debug('Station files: %s', ', '.join([os.path.basename(x) for x in file_list]))
+        ds = dataset_from_filelist(file_list)
+
+        # Simple unit check - for the Altitude variable
+        check_altitude_unit = ds['altitude'].attrs['units'] == 'm'
+        if not check_altitude_unit:
+            raise ValueError('unexpected altitude units <%s>', ds['altitude'].attrs['units'])
+
+        # Get the average lat,lon,alt
+        stats = xr.Dataset({'lat': ds['latitude'].mean(),
+                            'lon': ds['longitude'].mean(),
+                            'alt': ds['altitude'].mean()}).compute()
+        meanlon = float(stats['lon'])
+        if meanlon < 0:
+            meanlon = meanlon + 360
+        station_latlonalt = {'lat': float(stats['lat']), 'lon': meanlon, 'alts': float(stats['alt'])}
+        _logger.debug("  %s" % station_latlonalt)
 
         # Wrangle -- Do the things to the Obs dataset.
-        _logger.debug("Converting datetime format and units...")
-        for i, (k, v) in enumerate(ds_obs_dict.items()):
-            _logger.debug('  %s', k)
-            ds_obs_dict[k] = (v
-                              .set_coords(['time', 'time_decimal', 'latitude', 'longitude', 'altitude'])
-                              .sortby(['time'])
-                              .swap_dims({"obs": "time"})
-                              .pipe(ensure_dataset_datetime64)
-                              .rename({'value': 'co2'})
-                              .pipe(co2_molfrac_to_ppm, co2_var_name='co2')
-                              )
-            if i == 0:
-                _logger.debug("  the first DataSet has a time range of <%s> to <%s>.",
-                              np.datetime_as_string(ds_obs_dict[k]['time'].values[0], unit='D'),
-                              np.datetime_as_string(ds_obs_dict[k]['time'].values[-1], unit='D'))
-        _logger.debug("Converting is done.")
-
-        return ds_obs_dict
+        ds = (ds
+              .set_coords(['time', 'time_decimal', 'latitude', 'longitude', 'altitude'])
+              .sortby(['time'])
+              .swap_dims({"obs": "time"})
+              .pipe(ensure_dataset_datetime64)
+              .rename({'value': 'co2'})
+              .pipe(co2_molfrac_to_ppm, co2_var_name='co2')
+              # Values in ppm have only a few significant digits, so single precision halves the memory moved.
+              .assign(co2=lambda d: d['co2'].astype('float32', copy=False))
+              )
+
+        return stationcode, ds, station_latlonalt
 
     def plot_station_time_series(self, stationshortname: str) -> (plt.Figure, plt.Axes, tuple):
         """Make timeseries plot of co2 concentration for each surface observing station.
@@ -336,13 +368,22 @@ class Collection(Multiset):
         tuple
             Extra matplotlib artists used for the bounding box (bbox) when saving a figure
         """
+        # The columns of the resampled DataFrame are plotted as arrays.
+        # Times are converted to matplotlib date numbers once, rather than implicitly for each artist.
+        xs = mdates.date2num(ensure_datetime64_array(self.df_combined_and_resampled['time'].to_numpy()))
+        y_orig = self.df_combined_and_resampled['obs_original_resolution'].to_numpy()
+        y_resamp = self.df_combined_and_resampled['obs_resampled_resolution'].to_numpy()
+
         fig, ax = plt.subplots(nrows=1, ncols=1, sharex=True, sharey=True, figsize=(7, 5))
-        ax.plot(ensure_datetime64_array(self.df_combined_and_resampled['time']),
-                self.df_combined_and_resampled['obs_original_resolution'],
-                label='NOAA Obs',
-                marker='+', linestyle='None', color='#C0C0C0', alpha=0.6)
-        ax.plot(ensure_datetime64_array(self.df_combined_and_resampled['time']),
-                self.df_combined_and_resampled['obs_resampled_resolution'],
+        # The x-limits (with the axes' usual margin) are fixed before plotting, so x-autoscaling isn't recomputed.
+        ax.xaxis_date()
+        xpad = ax.margins()[0] * (xs.max() - xs.min())
+        ax.set_xlim(xs.min() - xpad, xs.max() + xpad)
+        ax.set_autoscalex_on(False)
+        ax.scatter(xs, y_orig,
+                   label='NOAA Obs',
+                   marker='+', color='#C0C0C0', alpha=0.6)
+        ax.plot(xs, y_resamp,
                 label='NOAA Obs monthly mean',
                 linestyle='-', color=(0 / 255, 133 / 255, 202 / 255), linewidth=2)
         #
@@ -351,8 +392,8 @@ class Collection(Multiset):
         # ax[i].set_ylabel('$ppm$')
         #     ax.legend(bbox_to_anchor=(1.05, 1))
         ax.set_ylabel('$CO_2$ (ppm)')
-        ax.text(0.02, 0.88, f"{stationshortname.upper()}\n{self.station_dict[stationshortname]['lat']:.1f}, "
-                            f"{self.station_dict[stationshortname]['lon']:.1f}",
+        ax.text(0.02, 0.88, f"{stationshortname.upper()}\n{self.station_meta[stationshortname]['lat']:.1f}, "
+                            f"{self.station_meta[stationshortname]['lon']:.1f}",
                 horizontalalignment='left',
                 verticalalignment='center',
                 transform=ax.transAxes,
@@ -363,7 +404,7 @@ class Collection(Multiset):
         # Define the date format
         #             ax.xaxis.set_major_locator(mdates.YearLocator())
         #             date_form = DateFormatter("%b\n%Y")
-        date_form = DateFormatter("%Y")
+        date_form = FuncFormatter(lambda x, _: f"{mdates.num2date(x).year}")
         ax.xaxis.set_major_formatter(date_form)
         #         ax.xaxis.set_minor_locator(mdates.MonthLocator())
         #         ax.tick_params(which="both", bottom=True)
@@ -393,6 +434,51 @@ class Collection(Multiset):
         return strrep
 
 
+@functools.lru_cache(maxsize=8)
+def _load_stations_cached(station_codes: tuple,
+                          datadir: str,
+                          mtime_ns: int
+                          ) -> (dict, dict):
+    """Load the data for surface observing stations, memoized on a hashable key.
+
+    Parameters
+    ----------
+    station_codes : `tuple`
+        the results are ordered as these codes are
+    datadir : `str`
+        absolute path of the directory containing the Globalview+ NetCDF files.
+    mtime_ns : `int`
+        modification time of the directory (used only as part of the memoization key)
+
+    Returns
+    -------
+    `dict`
+        Datasets for each station
+    `dict`
+        Latitudes, longitudes, and altitudes of each station
+    """
+    # The directory is scanned once, and files are grouped by station code.
+    _logger.debug('data directory: %s', datadir)
+    files_by_code = get_dict_of_station_filepaths(datadir, station_codes=station_codes)
+
+    # Stations are loaded concurrently, since each one is dominated by file I/O.
+    ds_obs_dict = {}
+    latlonalt_by_code = {}
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+        results = executor.map(lambda code: Collection._load_one_station(code, files_by_code.get(code, [])),
+                               station_codes)
+        for i, (stationcode, ds, station_latlonalt) in enumerate(results):
+            ds_obs_dict[stationcode] = ds
+            latlonalt_by_code[stationcode] = station_latlonalt
+            if i == 0:
+                _logger.debug("  the first DataSet has a time range of <%s> to <%s>.",
+                              np.datetime_as_string(ds['time'].values[0], unit='D'),
+                              np.datetime_as_string(ds['time'].values[-1], unit='D'))
+    _logger.debug("Loading is done.")
+
+    return ds_obs_dict, latlonalt_by_code
+
+
 def add_surface_station_collection_args_to_parser(parser: argparse.ArgumentParser) -> None:
     """Add recipe arguments to a parser object
 
@@ -1,12 +1,17 @@
 from gdess.operations.time import ensure_dataset_datetime64
 from gdess.operations.datasetdict import DatasetDict
 from gdess.operations.convert import co2_molfrac_to_ppm
+import dask
 import numpy as np
 import xarray as xr
 import os, logging
+from functools import partial
 
 _logger = logging.getLogger(__name__)
 
+# Default number of observations per dask chunk (a power of two, to line up with typical HDF5 chunking)
+OBS_CHUNK_SIZE = 65536
+
 
 def dataset_from_filelist(file_list: list,
                           vars_to_keep: list = None,
@@ -17,11 +22,12 @@ def dataset_from_filelist(file_list: list,
     ----------
     file_list
     vars_to_keep: list
-    decode_times: parameter passed to Xarray.open_dataset()
+    decode_times: parameter passed to Xarray.open_mfdataset()
 
     Returns
     -------
     An xr.Dataset
+        The files are opened in parallel, and the data are lazily loaded as dask arrays.
     """
     if vars_to_keep is None:
         # These are the default variables to keep if not overridden by a passed parameter.
@@ -31,41 +37,104 @@ def dataset_from_filelist(file_list: list,
                         'qcflag', 'dataset_platform', 'dataset_project',
                         'obspack_num', 'obspack_id']
 
-    ds_list = []
-    for i, f in enumerate(file_list):
-        thisds = xr.open_dataset(f, decode_times=decode_times)
+    # Chunks are set when opening, so that later time selections only read the relevant chunks from disk.
+    chunksize = obs_chunk_size(file_list[0]) if file_list else OBS_CHUNK_SIZE
+    ds = xr.open_mfdataset(file_list,
+                           preprocess=partial(_prepare_obspack_file, vars_to_keep=vars_to_keep),
+                           combine='nested', concat_dim='obs',
+                           parallel=True, chunks={'obs': chunksize},
+                           decode_times=decode_times)
+
+    return ds
+
 
-        # If the following variables are not present, continue loading and just make them blank DataArrays
-        #    Otherwise, we will raise an error
-        possible_missing_vars = ['pressure', 'qcflag', 'value_std_dev', 'nvalue']
-        for pmv in possible_missing_vars:
-            if not (pmv in thisds.keys()):
-                blankarray = xr.DataArray(data=[np.nan], dims='obs', name=pmv).squeeze()
-                thisds = thisds.assign({pmv: blankarray})
+def _open_station_files(file_list: list) -> tuple:
+    """Open the files of one station, and read its latitudes and longitudes.
+
+    Parameters
+    ----------
+    file_list : list
 
-        # Only the specified variables are retained.
-        to_drop = []
-        for vname in thisds.keys():
-            if not (vname in vars_to_keep):
-                to_drop.append(vname)
-        newds = thisds.drop_vars(to_drop)
+    Returns
+    -------
+    tuple
+        the (lazily loaded) xr.Dataset, and numpy arrays of its latitudes and longitudes
+    """
+    ds = dataset_from_filelist(file_list)
+    return ds, ds['latitude'].values, ds['longitude'].values
 
-        # Dataset attributes 'platform' and 'project' are copied to every data point along the 'obs' dimension.
-        n_obs = len(thisds['obs'])
-        newds = newds.assign(dataset_platform=xr.DataArray([thisds.attrs['dataset_platform']] * n_obs, dims='obs'))
-        newds = newds.assign(dataset_project=xr.DataArray([thisds.attrs['dataset_project']] * n_obs, dims='obs'))
 
-        ds_list.append(newds)
-        #     if i > 100:
-        #         break
+def obs_chunk_size(filepath: str,
+                   varname: str = 'value',
+                   target: int = OBS_CHUNK_SIZE) -> int:
+    """Choose a dask chunk size along 'obs' that is a whole multiple of the file's on-disk chunking.
 
-    ds = xr.concat(ds_list, dim='obs')
+    Parameters
+    ----------
+    filepath : str
+    varname : str, default 'value'
+        the variable whose on-disk (HDF5) chunking is inspected
+    target : int, default OBS_CHUNK_SIZE
+        the approximate number of observations desired per chunk
 
-    return ds
+    Returns
+    -------
+    int
+        the target size, if the variable is stored contiguously or isn't found
+    """
+    # The file is opened through xarray (lazily, with no decoding), so that its netCDF/HDF5 lock is used,
+    #   as concurrent threads may be reading other files at the same time.
+    with xr.open_dataset(filepath, decode_cf=False) as ds:
+        if varname not in ds.variables:
+            return target
+        ondisk = ds[varname].encoding.get('chunksizes')
+    if not ondisk:
+        return target
+    ondisk_obs = int(ondisk[0])
+    return max(1, target // ondisk_obs) * ondisk_obs
+
+
+def _prepare_obspack_file(thisds: xr.Dataset,
+                          vars_to_keep: list
+                          ) -> xr.Dataset:
+    """Format a single ObsPack file's Dataset so that it can be concatenated with others along 'obs'.
+
+    Parameters
+    ----------
+    thisds : xr.Dataset
+    vars_to_keep : list
+
+    Returns
+    -------
+    An xr.Dataset
+    """
+    # If the following variables are not present, continue loading and just make them blank DataArrays
+    #    Otherwise, we will raise an error
+    possible_missing_vars = ['pressure', 'qcflag', 'value_std_dev', 'nvalue']
+    for pmv in possible_missing_vars:
+        if not (pmv in thisds.keys()):
+            blankarray = xr.DataArray(data=[np.nan], dims='obs', name=pmv).squeeze()
+            thisds = thisds.assign({pmv: blankarray})
+
+    # Only the specified variables are retained.
+    to_drop = []
+    for vname in thisds.keys():
+        if not (vname in vars_to_keep):
+            to_drop.append(vname)
+    newds = thisds.drop_vars(to_drop)
+
+    # Dataset attributes 'platform' and 'project' are copied to every data point along the 'obs' dimension.
+    n_obs = len(thisds['obs'])
+    newds = newds.assign(dataset_platform=xr.DataArray([thisds.attrs['dataset_platform']] * n_obs, dims='obs'))
+    newds = newds.assign(dataset_project=xr.DataArray([thisds.attrs['dataset_project']] * n_obs, dims='obs'))
+
+    return newds
 
 
 def load_data_with_regex(datadir: str,
                          compiled_regex_pattern=None,
+                         name_prefix: str = '',
+                         name_suffix: str = '.nc'
                          ) -> DatasetDict:
     """Load into memory the data from regex-defined files of Globalview+.
 
@@ -74,6 +143,10 @@ def load_data_with_regex(datadir: str,
     datadir
         directory containing the Globalview+ NetCDF files.
     compiled_regex_pattern
+    name_prefix : str, default ''
+        filenames not starting with this are skipped before the regex is tried (e.g. 'co2_')
+    name_suffix : str, default '.nc'
+        filenames not ending with this are skipped before the regex is tried (use '' to disable)
 
     Returns
     -------
@@ -83,12 +156,14 @@ def load_data_with_regex(datadir: str,
     # --- Go through files and extract all files found via the regex pattern search ---
     # file_dict = {s.group(1): f for f in os.listdir(datadir) if (s := compiled_regex_pattern.search(f))}
     file_dict = dict()
-    for f in os.listdir(datadir):
-        if s := compiled_regex_pattern.search(f):
-            if s.group(1) not in file_dict.keys():
-                file_dict[s.group(1)] = [f]
-            else:
-                file_dict[s.group(1)].append(f)
+    with os.scandir(datadir) as it:
+        for entry in it:
+            f = entry.name
+            # A cheap string check rules out most non-matching files before the regex is run.
+            if not (f.startswith(name_prefix) and f.endswith(name_suffix)):
+                continue
+            if s := compiled_regex_pattern.search(f):
+                file_dict.setdefault(s.group(1), []).append(f)
     _logger.debug('%s', '\n'.join([item for sublist in
                                    [[os.path.basename(ele) for ele in x]
                                     for x in file_dict.values()]
@@ -96,14 +171,17 @@ def load_data_with_regex(datadir: str,
                                   )
                   )
 
+    # Stations are opened in parallel.
+    opened = dask.compute(*[dask.delayed(_open_station_files)([os.path.join(datadir, f) for f in file_list])
+                            for file_list in file_dict.values()],
+                          scheduler='threads')
+
     ds_obs_dict = {}
     site_dict = {}
-    for i, (sitecode, file_list) in enumerate(file_dict.items()):
-        ds_obs_dict[sitecode] = dataset_from_filelist([os.path.join(datadir, f) for f in file_list])
-        site_dict[sitecode] = {'name': ds_obs_dict[sitecode].site_name}
+    for i, (sitecode, (ds, lats, lons)) in enumerate(zip(file_dict.keys(), opened)):
+        ds_obs_dict[sitecode] = ds
+        site_dict[sitecode] = {'name': ds.site_name}
 
-        lats = ds_obs_dict[sitecode]['latitude'].values
-        lons = ds_obs_dict[sitecode]['longitude'].values
         # Get the latitude and longitude of each station
         #     different_station_lats = np.unique(lats)
         #     different_station_lons = np.unique(lons)
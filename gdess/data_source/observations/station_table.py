@@ -0,0 +1,108 @@
+"""Columnar storage of surface station metadata.
+
+Station codes, names, and coordinates are held in parallel NumPy arrays,
+so that bulk operations (e.g. selecting stations within a lat/lon box) are vectorized.
+"""
+from typing import Mapping, Union
+
+import numpy as np
+
+
+class StationTable:
+    """Parallel arrays of station codes, names, latitudes, longitudes, and altitudes."""
+
+    def __init__(self, station_dict: Mapping):
+        """Instantiate a StationTable from a station dictionary.
+
+        Parameters
+        ----------
+        station_dict : Mapping
+            Contains (keys) station codes, and for each station (values) a mapping with at least a 'name' key.
+            Optional keys 'lat', 'lon', and 'alts' are used to fill in the coordinates.
+        """
+        n = len(station_dict)
+        self.codes = np.array(list(station_dict.keys()), dtype=str)
+        self.names = np.array([v['name'] for v in station_dict.values()], dtype=str)
+        self.lats = np.full(n, np.nan, dtype=np.float64)
+        self.lons = np.full(n, np.nan, dtype=np.float64)
+        self.alts = np.full(n, np.nan, dtype=np.float64)
+        self._index = {code: i for i, code in enumerate(station_dict.keys())}
+
+        for code, v in station_dict.items():
+            self.update(code, v)
+
+    def code_index(self, code: str) -> int:
+        """Get the position of a station in the arrays
+
+        Parameters
+        ----------
+        code : str
+
+        Raises
+        ------
+        KeyError
+            If the station code is not in the table
+
+        Returns
+        -------
+        int
+        """
+        return self._index[code]
+
+    def update(self, code: str, latlonalt: Mapping) -> None:
+        """Set the coordinates of a station
+
+        Parameters
+        ----------
+        code : str
+        latlonalt : Mapping
+            may contain the keys 'lat', 'lon', and 'alts'
+        """
+        i = self._index[code]
+        if 'lat' in latlonalt:
+            self.lats[i] = latlonalt['lat']
+        if 'lon' in latlonalt:
+            self.lons[i] = latlonalt['lon']
+        if 'alts' in latlonalt:
+            self.alts[i] = latlonalt['alts']
+
+    def select_box(self,
+                   lat_bounds: tuple,
+                   lon_bounds: tuple
+                   ) -> np.ndarray:
+        """Get the codes of the stations located within a lat/lon box (bounds are inclusive)
+
+        Parameters
+        ----------
+        lat_bounds : tuple
+            (minimum latitude, maximum latitude)
+        lon_bounds : tuple
+            (minimum longitude, maximum longitude)
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        idx = np.flatnonzero((self.lats >= lat_bounds[0]) & (self.lats <= lat_bounds[1]) &
+                             (self.lons >= lon_bounds[0]) & (self.lons <= lon_bounds[1]))
+        return self.codes[idx]
+
+    def get(self, code: str, default=None) -> Union[dict, None]:
+        """Get a dictionary of a station's name and coordinates, or a default value if the code isn't present"""
+        if code not in self._index:
+            return default
+        return self[code]
+
+    def __getitem__(self, code: str) -> dict:
+        """Get a dictionary of a station's name and coordinates"""
+        i = self._index[code]
+        return {'name': str(self.names[i]),
+                'lat': float(self.lats[i]),
+                'lon': float(self.lons[i]),
+                'alts': float(self.alts[i])}
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._index
+
+    def __len__(self) -> int:
+        return len(self.codes)
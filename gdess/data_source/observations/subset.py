@@ -1,6 +1,7 @@
 from gdess import _change_log_level, validate_verbose
 from gdess.formatters.nums import numstr
 import numpy as np
+import pandas as pd
 import xarray as xr
 from typing import Union
 import logging
@@ -124,18 +125,35 @@ def by_datetime(dataset: xr.Dataset,
 
     # We start with the passed-in dataset.
     orig_shape = dataset['time'].shape
-    keep_mask = np.full(orig_shape, True)
     func_log.debug("Original # data points: %s", numstr(orig_shape[0], 0))
 
     # The data are subsetted by year.
-    keep_mask = keep_mask & (dataset['time'] >= start)
-    keep_mask = keep_mask & (dataset['time'] < end)
-    if not keep_mask.data.any():
-        func_log.debug(" -- subset between <start=%s and end=%s> -- NO DATA POINTS",
-                       start,
-                       end,)
-        return None
-    ds_year = dataset.where(keep_mask, drop=True)
+    times = dataset['time'].values
+    if times.ndim == 1:
+        # Data points are selected by position, so variable dtypes are kept, and variables without time are untouched.
+        if pd.Index(times).is_monotonic_increasing:
+            # For sorted times, the two cut indices are found by binary search.
+            i0, i1 = np.searchsorted(times, [np.datetime64(start), np.datetime64(end)], side='left')
+            indexer = slice(i0, i1) if (i0 < i1) else None
+        else:
+            keep = np.flatnonzero((times >= start) & (times < end))
+            indexer = keep if keep.size else None
+        if indexer is None:
+            func_log.debug(" -- subset between <start=%s and end=%s> -- NO DATA POINTS",
+                           start,
+                           end,)
+            return None
+        ds_year = dataset.isel({dataset['time'].dims[0]: indexer})
+    else:
+        keep_mask = np.full(orig_shape, True)
+        keep_mask = keep_mask & (dataset['time'] >= start)
+        keep_mask = keep_mask & (dataset['time'] < end)
+        if not keep_mask.data.any():
+            func_log.debug(" -- subset between <start=%s and end=%s> -- NO DATA POINTS",
+                           start,
+                           end,)
+            return None
+        ds_year = dataset.where(keep_mask, drop=True)
     ds_year_shape = ds_year['time'].shape
     func_log.debug(" -- subset between <start=%s and end=%s> -- # data points: %s",
                    start,
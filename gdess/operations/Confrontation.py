@@ -2,7 +2,9 @@ import argparse
 import csv, sys, logging
 from typing import Union, Iterable
 from datetime import datetime
+from functools import partial
 
+import dask
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -78,55 +80,31 @@ class Confrontation:
         processed_station_metadata = dict(lat=[], lon=[], code=[], fullname=[])
         data_dict = dict(ref=[], mdl=[])  # each key will contain a list of Dataframes.
         num_stations = [len(self.stations_to_analyze)]
-        for station in self.stations_to_analyze:
-            _logger.info("Station %s of %s: %s", counter['current'], num_stations[0], station)
-            obs_collection = obspack_surface_collection_module.Collection(verbose=self.verbose)
-            obs_collection.preprocess(datadir=self.opts.ref_data, station_name=station)
-            ds_obs = obs_collection.stepA_original_datasets[station]
-            _logger.info('  %s', obs_collection.station_dict.get(station))
-
-            # Apply time bounds, and get the relevant model output.
-            try:
-                if self.compare_against_model:
-                    ds_obs, da_mdl = make_comparable(ds_obs, self.ds_mdl,
-                                                     time_limits=(
-                                                     np.datetime64(self.opts.start_yr), np.datetime64(self.opts.end_yr)),
-                                                     latlon=(
-                                                     ds_obs['latitude'].values[0], ds_obs['longitude'].values[0]),
-                                                     altitude=ds_obs['altitude'].values[0], altitude_method='lowest',
-                                                     global_mean=self.opts.globalmean, verbose=self.verbose)
-                else:
-                    ds_obs, _, _, _, _ = apply_time_bounds(ds_obs, time_limits=(np.datetime64(self.opts.start_yr),
-                                                                          np.datetime64(self.opts.end_yr)))
-                    da_mdl = None
-            except (RuntimeError, AssertionError) as re:
-                update_for_skipped_station(re, station, num_stations, counter)
+        time_limits = (self.opts.start_datetime, self.opts.end_datetime)
+        # (The shared arguments are bound with partial, so that dask doesn't compute the lazy model dataset
+        #  as it would for a dask collection passed directly as an argument to a delayed call.)
+        process_one = dask.delayed(partial(_process_station, how=how,
+                                           compare_against_model=self.compare_against_model, ds_mdl=self.ds_mdl,
+                                           opts=self.opts, time_limits=time_limits, verbose=self.verbose))
+        tasks = [process_one(station) for station in self.stations_to_analyze]
+        # Plotting the filter components uses the (non-thread-safe) pyplot state machine and a fixed file name,
+        #   so in that case the stations are processed one at a time, in the calling thread.
+        scheduler = 'synchronous' if getattr(self.opts, 'plot_filter_components', False) else 'threads'
+        results = dask.compute(*tasks, scheduler=scheduler)
+
+        for station, result in zip(self.stations_to_analyze, results):
+            if isinstance(result, Exception):
+                update_for_skipped_station(result, station, num_stations, counter)
                 continue
-            #
-            if how == 'seasonal':
-                try:
-                    ref_dt, ref_vals, mdl_dt, mdl_vals = get_seasonal_by_curve_fitting(self.compare_against_model,
-                                                                                       da_mdl, ds_obs,
-                                                                                       self.opts, station)
-                except RuntimeError as re:
-                    update_for_skipped_station(re, station, num_stations, counter)
-                    continue
-                #
-                data_dict['ref'].append(pd.DataFrame.from_dict({"month": ref_dt, f"{station}": ref_vals}))
-                if self.compare_against_model:
-                    data_dict['mdl'].append(pd.DataFrame.from_dict({"month": mdl_dt, f"{station}": mdl_vals}))
-            elif how == 'trend':
-                data_dict['ref'].append(pd.DataFrame.from_dict({"time": ds_obs['time'], f"{station}": ds_obs['co2'].values}))
-                if self.compare_against_model:
-                    data_dict['mdl'].append(pd.DataFrame.from_dict({"time": da_mdl['time'], f"{station}": da_mdl.values}))
-            else:
-                raise ValueError("Unexpected value for 'how' to do the Confrontation. Got %s." % how)
-
-            # Gather together station's metadata at the loop end, when we're sure that this station has been processed.
-            processed_station_metadata['lon'].append(obs_collection.station_dict[station]['lon'])
-            processed_station_metadata['lat'].append(obs_collection.station_dict[station]['lat'])
-            processed_station_metadata['fullname'].append(obs_collection.station_dict[station]['name'])
-            processed_station_metadata['code'].append(station)
+            _logger.info("Station %s of %s: %s", counter['current'], num_stations[0], station)
+            df_ref, df_mdl, station_metadata = result
+            data_dict['ref'].append(df_ref)
+            if self.compare_against_model:
+                data_dict['mdl'].append(df_mdl)
+
+            # Gather together station's metadata, now that we're sure that this station has been processed.
+            for k, v in station_metadata.items():
+                processed_station_metadata[k].append(v)
             counter['current'] += 1
             # END of station loop
 
@@ -274,20 +252,18 @@ class Confrontation:
             metadata for all stations.
         """
         # Dataframes for each location are combined so we have one 'month' column, and a single column for each station.
-        # First, dataframes are sorted by latitude, then combined, then the duplicate 'month' columns are removed.
+        # First, dataframes are sorted by latitude, then their (non-duplicate) columns are combined.
         df_station_metadata = pd.DataFrame.from_dict(processed_station_metadata)
         df_concatenated = dict(ref=None, mdl=None)
 
         #   (i) Globalview+ data
         data_dict['ref'] = [x for _, x in sorted(zip(list(df_station_metadata['lat']), data_dict['ref']))]
-        df_concatenated['ref'] = pd.concat(data_dict['ref'], axis=1, sort=False)
-        df_concatenated['ref'] = df_concatenated['ref'].loc[:, ~df_concatenated['ref'].columns.duplicated()]
+        df_concatenated['ref'] = _combine_columns(data_dict['ref'])
 
         #   (ii) CMIP data
         if self.compare_against_model:
             data_dict['mdl'] = [x for _, x in sorted(zip(list(df_station_metadata['lat']), data_dict['mdl']))]
-            df_concatenated['mdl'] = pd.concat(data_dict['mdl'], axis=1, sort=False)
-            df_concatenated['mdl'] = df_concatenated['mdl'].loc[:, ~df_concatenated['mdl'].columns.duplicated()]
+            df_concatenated['mdl'] = _combine_columns(data_dict['mdl'])
         #
         # Sort the metadata after using it for sorting the cycle list(s)
         df_station_metadata.sort_values(by='lat', ascending=True, inplace=True)
@@ -295,6 +271,108 @@ class Confrontation:
         return df_concatenated, df_station_metadata
 
 
+def _combine_columns(frames: list) -> pd.DataFrame:
+    """Combine DataFrames side by side, keeping only the first occurrence of each column name
+
+    Columns are gathered into a single dictionary and the DataFrame is built once,
+    rather than concatenating all columns (including every duplicate time column) and then removing duplicates.
+    Columns of unequal length are padded at the end with NaN (or NaT).
+
+    Parameters
+    ----------
+    frames : list
+        DataFrames with default (Range) indexes
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    columns = dict()
+    for df in frames:
+        for name in df.columns:
+            if name not in columns:
+                columns[name] = pd.Series(df[name].to_numpy(), name=name)
+    return pd.DataFrame(columns)
+
+
+def _process_station(station: str,
+                     how: str,
+                     compare_against_model: bool,
+                     ds_mdl: xr.Dataset,
+                     opts: argparse.Namespace,
+                     time_limits: tuple,
+                     verbose: Union[bool, str] = False
+                     ) -> Union[tuple, Exception]:
+    """Load and process the observations (and matching model output) for a single station location
+
+    Parameters
+    ----------
+    station : str
+    how : str
+        either 'seasonal' or 'trend'
+    compare_against_model : bool
+    ds_mdl : xarray.Dataset
+    opts : argparse.Namespace
+    time_limits : tuple
+        the start and end times, as numpy.datetime64
+    verbose : Union[bool, str], default False
+
+    Raises
+    ------
+    ValueError
+
+    Returns
+    -------
+    tuple or Exception
+        a DataFrame of reference data, a DataFrame of model data (or None), and a dict of station metadata;
+        or, if the station is to be skipped, the RuntimeError or AssertionError that explains why
+    """
+    obs_collection = obspack_surface_collection_module.Collection(verbose=verbose)
+    obs_collection.preprocess(datadir=opts.ref_data, station_name=station)
+    ds_obs = obs_collection.stepA_original_datasets[station]
+    _logger.info('  %s %s', obs_collection.station_dict.get(station), obs_collection.station_meta.get(station))
+
+    # Apply time bounds, and get the relevant model output.
+    try:
+        if compare_against_model:
+            ds_obs, da_mdl = make_comparable(ds_obs, ds_mdl,
+                                             time_limits=time_limits,
+                                             latlon=(ds_obs['latitude'].values[0], ds_obs['longitude'].values[0]),
+                                             altitude=ds_obs['altitude'].values[0], altitude_method='lowest',
+                                             global_mean=opts.globalmean, verbose=verbose)
+        else:
+            ds_obs, _, _, _, _ = apply_time_bounds(ds_obs, time_limits=time_limits)
+            da_mdl = None
+    except (RuntimeError, AssertionError) as re:
+        return re
+    #
+    df_mdl = None
+    if how == 'seasonal':
+        try:
+            ref_dt, ref_vals, mdl_dt, mdl_vals = get_seasonal_by_curve_fitting(compare_against_model,
+                                                                               da_mdl, ds_obs,
+                                                                               opts, station)
+        except RuntimeError as re:
+            return re
+        #
+        df_ref = pd.DataFrame.from_dict({"month": ref_dt, f"{station}": ref_vals})
+        if compare_against_model:
+            df_mdl = pd.DataFrame.from_dict({"month": mdl_dt, f"{station}": mdl_vals})
+    elif how == 'trend':
+        df_ref = pd.DataFrame.from_dict({"time": ds_obs['time'], f"{station}": ds_obs['co2'].values})
+        if compare_against_model:
+            df_mdl = pd.DataFrame.from_dict({"time": da_mdl['time'], f"{station}": da_mdl.values})
+    else:
+        raise ValueError("Unexpected value for 'how' to do the Confrontation. Got %s." % how)
+
+    station_metadata = {'lon': obs_collection.station_meta[station]['lon'],
+                        'lat': obs_collection.station_meta[station]['lat'],
+                        'fullname': obs_collection.station_dict[station]['name'],
+                        'code': station}
+
+    return df_ref, df_mdl, station_metadata
+
+
 def make_comparable(ref: xr.Dataset,
                     com: xr.Dataset,
                     **keywords
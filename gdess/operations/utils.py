@@ -11,9 +11,17 @@ import os
 import logging
 from typing import Union, Sequence
 
+import dask
+import numpy as np
 import pandas as pd
 import xarray as xr
 
+try:
+    # numbagg is optional. It provides fast (numba-compiled) NaN-aware reductions for numpy-backed data.
+    import numbagg
+except ImportError:
+    numbagg = None
+
 _logger = logging.getLogger(__name__)
 
 
@@ -42,16 +50,14 @@ def print_var_summary(dataset: xr.Dataset,
     -------
     None or an xarray.Dataset
     """
-    # We check if there are units specified for this variable
-    vu = None
-    if 'units' in dataset[varname].attrs:
-        vu = dataset[varname].units
-    # We check if there is a long name specified for this variable
-    ln = None
-    if 'long_name' in dataset[varname].attrs:
-        ln = dataset[varname].long_name
+    # The variable (and its attributes) are looked up once.
+    da = dataset[varname]
+    attrs = da.attrs
+    # We check if there are units and a long name specified for this variable
+    vu = attrs.get('units')
+    ln = attrs.get('long_name')
 
-    stats_dict = get_var_stats(dataset[varname])
+    stats_dict = get_var_stats(da)
 
     _logger.info("Summary for <%s>%s%s:",
                  varname,
@@ -61,8 +67,7 @@ def print_var_summary(dataset: xr.Dataset,
     _logger.info("  mean: %s", str(stats_dict['mean']))
     _logger.info("  max: %s", str(stats_dict['max']))
 
-    my_shape = dataset[varname].shape
-    dim_strings = [f"{d}: {my_shape[i]}" for i, d in enumerate(dataset[varname].dims)]
+    dim_strings = [f"{d}: {n}" for d, n in zip(da.dims, da.shape)]
     _logger.info("  shape: (" + ', '.join(dim_strings) + ")")
 
     if return_dataset:
@@ -155,8 +160,17 @@ def get_var_stats(dataarray: xr.DataArray) -> dict:
     -------
     `dict`
     """
+    if hasattr(dataarray.data, 'compute'):
+        mn, me, mx = (r.item()
+                      for r in dask.compute(dataarray.min().data, dataarray.mean().data, dataarray.max().data))
+    elif (numbagg is not None) and np.issubdtype(dataarray.dtype, np.floating):
+        # (numbagg's reductions only cover numeric types, so other dtypes use the xarray reductions below.)
+        arr = np.asarray(dataarray.data)
+        mn, me, mx = (r.item() for r in (numbagg.nanmin(arr), numbagg.nanmean(arr), numbagg.nanmax(arr)))
+    else:
+        mn, me, mx = (r.item() for r in (dataarray.min().data, dataarray.mean().data, dataarray.max().data))
     return {
-        'min': dataarray.min().values.item(),
-        'mean': dataarray.mean().values.item(),
-        'max': dataarray.max().values.item()
+        'min': mn,
+        'mean': me,
+        'max': mx
     }
@@ -6,10 +6,14 @@ This function parses:
  - observational data from Globalview+ surface stations
  - model output from CMIP6
 """
+import sys
 import logging
 import argparse
+import contextlib
 from typing import Union
 
+import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 from dask.diagnostics import ProgressBar
 
@@ -60,10 +64,12 @@ def surface_trends(options: Union[dict, argparse.Namespace],
         The data that were plotted.
     """
     set_verbose(_logger, verbose)
-    if verbose:
-        ProgressBar().register()
     _logger.debug("Parsing diagnostic parameters...")
     opts = parse_recipe_options(options, add_surface_trends_args_to_parser)
+    # The time bounds (parsed once, with the options) are checked before any data are loaded.
+    if (opts.end_datetime is not None) and not (opts.start_datetime < opts.end_datetime):
+        _logger.error("The start year <%s> must be before the end year <%s>.", opts.start_yr, opts.end_yr)
+        sys.exit(1)
 
     stations_to_analyze = populate_station_list(run_all_stations=False, station_list=opts.station_list)
 
@@ -71,9 +77,11 @@ def surface_trends(options: Union[dict, argparse.Namespace],
     compare_against_model, ds_mdl = load_cmip_model_output(opts.model_name, opts.cmip_load_method, verbose=verbose)
 
     conf = Confrontation(compare_against_model, ds_mdl, opts, stations_to_analyze, verbose)
-    cycles_of_each_station, concatenated_dfs, df_station_metadata, \
-        xdata_obs, xdata_mdl, ydata_obs, ydata_mdl, \
-        rmse_y_true, rmse_y_pred = conf.looper(how='trend')
+    # A progress bar is shown (only for this computation) when running verbosely.
+    with (ProgressBar() if verbose else contextlib.nullcontext()):
+        cycles_of_each_station, concatenated_dfs, df_station_metadata, \
+            xdata_obs, xdata_mdl, ydata_obs, ydata_mdl, \
+            rmse_y_true, rmse_y_pred = conf.looper(how='trend')
 
     # --- Create Graphic ---
     fig, ax = plt.subplots(1, 1, figsize=(6, 4))
@@ -83,12 +91,14 @@ def surface_trends(options: Union[dict, argparse.Namespace],
         for station in stations_to_analyze:
             merged = rmse_y_pred.loc[:, ['time', station]].merge(rmse_y_true.loc[:, ['time', station]],
                                                                  on='time', suffixes=("_pred", "_true"),)
-            merged['diff'] = merged[station + '_pred'] - merged[station + '_true']
+            # Both columns come from the same merged frame, so they are subtracted as arrays, skipping index alignment.
+            #   (The difference isn't inserted back into the merged frame; only the output Series wraps the array.)
+            diff = np.subtract(merged[station + '_pred'].to_numpy(), merged[station + '_true'].to_numpy())
             # Plot
-            ax.plot(merged['time'], merged['diff'],
+            ax.plot(merged['time'].to_numpy(), diff,
                     label=f"model - obs [{station}]",
                     marker='.', linestyle='none')
-            diffs[station] = merged['diff']
+            diffs[station] = pd.Series(diff, index=merged.index, name='diff', copy=False)
         #
         ax.set_ylim(limits_with_zero(ax.get_ylim()))
         #
@@ -120,4 +130,3 @@ def surface_trends(options: Union[dict, argparse.Namespace],
         _logger.info("Saved at <%s>" % savepath)
     return data_output
 
-
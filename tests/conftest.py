@@ -2,11 +2,11 @@ from pathlib import PurePath, Path
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def root_testdir():
     return Path(PurePath(__file__)).resolve().parent
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def globalview_test_data_path(root_testdir):
     return root_testdir / 'test_data' / 'globalview'
 
@@ -12,24 +12,31 @@ from gdess.data_source.observations.load import load_data_with_regex
 from gdess.data_source.observations.subset import binTimeLat, binLonLat, \
     by_datetime, bin_by_year_and_vertical, by_decimalyear
 from gdess.data_source.observations.gvplus_surface import Collection
+from gdess.data_source.observations.station_table import StationTable
 from gdess.data_source.observations.gvplus_name_utils import \
     get_dict_of_all_station_filenames, get_dict_of_station_codes_and_names
 
+_STATION_RE = re.compile(r'co2_([a-zA-Z0-9]*)_surface.*\.nc$')
+
 
 @pytest.fixture
 def newEmptySurfaceStation():
     mySurfaceInstance = Collection()
     return mySurfaceInstance
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def globalview_datasetdict(globalview_test_data_path):
-    p = re.compile(r'co2_([a-zA-Z0-9]*)_surface.*\.nc$')
-    return load_data_with_regex(globalview_test_data_path, compiled_regex_pattern=p)
+    return load_data_with_regex(globalview_test_data_path, compiled_regex_pattern=_STATION_RE)
 
 def test_station_MLO_is_present(newEmptySurfaceStation):
     station_dict = load_stations_dict()
     assert 'mlo' in station_dict
 
+def test_station_table_selects_stations_in_box():
+    table = StationTable({'mlo': {'name': 'Mauna Loa', 'lat': 19.5, 'lon': 204.4},
+                          'brw': {'name': 'Barrow', 'lat': 71.3, 'lon': 203.4}})
+    assert list(table.select_box(lat_bounds=(0, 30), lon_bounds=(180, 270))) == ['mlo']
+
 def test_station_MLO_in_all_station_filenames(globalview_test_data_path):
     a = get_dict_of_all_station_filenames(str(globalview_test_data_path) + os.sep)
     assert 'mlo' in a.keys()
@@ -55,6 +62,20 @@ def test_return_type_from_datetime_binning(globalview_datasetdict):
                          end=np.datetime64("2000-03-01"))
     assert isinstance(binned, xr.Dataset)
 
+def test_datetime_binning_sorted_and_unsorted_agree(globalview_datasetdict):
+    ds = globalview_datasetdict['mlo']
+    start, end = np.datetime64("2000-01-01"), np.datetime64("2000-03-01")
+    times = ds['time'].values
+    expected_count = int(((times >= start) & (times < end)).sum())
+
+    from_sorted = by_datetime(ds, start=start, end=end)
+    # Reversed times are not monotonic increasing, so the unsorted path is taken.
+    dim = ds['time'].dims[0]
+    from_unsorted = by_datetime(ds.isel({dim: slice(None, None, -1)}), start=start, end=end)
+
+    assert from_sorted.sizes[dim] == expected_count
+    xr.testing.assert_identical(from_sorted, from_unsorted.isel({dim: slice(None, None, -1)}))
+
 def test_return_type_from_binning_by_year_and_vertical(globalview_datasetdict):
     ds_out = bin_by_year_and_vertical(globalview_datasetdict['mlo'],
                                       my_year=2010, my_vertical_edges=np.array([10, 50]),